@@ -28,23 +28,28 @@ def upgrade() -> None:
         sa.Column("alias", sa.String, nullable=True),
     )
 
-    # 2. Insert distinct account values from positions into accounts
-    op.execute("INSERT INTO accounts (account) " "SELECT DISTINCT account FROM positions WHERE account IS NOT NULL")
-
-    # 3. Add account_id column to positions (nullable initially)
+    # 2. Add account_id column to positions (nullable initially)
     op.add_column("positions", sa.Column("account_id", sa.Integer, nullable=True))
 
-    # 4. Backfill account_id from accounts table
-    op.execute("UPDATE positions SET account_id = accounts.id " "FROM accounts WHERE positions.account = accounts.account")
+    # 3. Insert distinct account values and backfill account_id in one pass
+    op.execute(
+        "WITH inserted AS ("
+        "INSERT INTO accounts (account) "
+        "SELECT DISTINCT account FROM positions WHERE account IS NOT NULL "
+        "RETURNING id, account"
+        ") "
+        "UPDATE positions SET account_id = inserted.id "
+        "FROM inserted WHERE positions.account = inserted.account"
+    )
 
-    # 5. Make account_id NOT NULL
+    # 4. Make account_id NOT NULL
     op.alter_column("positions", "account_id", nullable=False)
 
-    # 6. Drop old unique constraint and account column
+    # 5. Drop old unique constraint and account column
     op.drop_constraint("uq_account_con_id", "positions", type_="unique")
     op.drop_column("positions", "account")
 
-    # 7. Add new unique constraint on (account_id, con_id)
+    # 6. Add new unique constraint on (account_id, con_id)
     op.create_unique_constraint("uq_account_id_con_id", "positions", ["account_id", "con_id"])
 
 
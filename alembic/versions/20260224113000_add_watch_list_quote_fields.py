@@ -8,8 +8,6 @@ Create Date: 2026-02-24 11:30:00.000000
 
 from typing import Sequence, Union
 
-import sqlalchemy as sa
-
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -20,26 +18,16 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column(
-        "watch_list_instruments",
-        sa.Column("bid_price", sa.Float(), nullable=True),
-    )
-    op.add_column(
-        "watch_list_instruments",
-        sa.Column("ask_price", sa.Float(), nullable=True),
-    )
-    op.add_column(
-        "watch_list_instruments",
-        sa.Column("close_price", sa.Float(), nullable=True),
-    )
-    op.add_column(
-        "watch_list_instruments",
-        sa.Column("quote_as_of", sa.DateTime(timezone=True), nullable=True),
+    # One ALTER TABLE for all four columns: a single lock window on
+    # watch_list_instruments instead of four.
+    op.execute(
+        "ALTER TABLE watch_list_instruments "
+        "ADD COLUMN bid_price DOUBLE PRECISION, "
+        "ADD COLUMN ask_price DOUBLE PRECISION, "
+        "ADD COLUMN close_price DOUBLE PRECISION, "
+        "ADD COLUMN quote_as_of TIMESTAMP WITH TIME ZONE"
     )
 
 
 def downgrade() -> None:
-    op.drop_column("watch_list_instruments", "quote_as_of")
-    op.drop_column("watch_list_instruments", "close_price")
-    op.drop_column("watch_list_instruments", "ask_price")
-    op.drop_column("watch_list_instruments", "bid_price")
+    op.execute("ALTER TABLE watch_list_instruments DROP COLUMN quote_as_of, DROP COLUMN close_price, DROP COLUMN ask_price, DROP COLUMN bid_price")
@@ -0,0 +1,51 @@
+"""replace jobs status index with partial runnable index
+
+Revision ID: dcd034f5dfb5
+Revises: 8a3de6b9f112
+Create Date: 2026-02-25 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "dcd034f5dfb5"
+down_revision: Union[str, Sequence[str], None] = "8a3de6b9f112"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The worker only claims queued, unarchived jobs; index just those rows.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_runnable",
+            "jobs",
+            ["available_at", "created_at"],
+            postgresql_where=sa.text("status = 'queued' AND archived_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_jobs_status_available_created",
+            table_name="jobs",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_status_available_created",
+            "jobs",
+            ["status", "available_at", "created_at"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_jobs_runnable",
+            table_name="jobs",
+            postgresql_concurrently=True,
+        )
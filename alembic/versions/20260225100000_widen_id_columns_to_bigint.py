@@ -0,0 +1,48 @@
+"""widen id and con_id columns to bigint
+
+Revision ID: 4816f65e05b6
+Revises: dcd034f5dfb5
+Create Date: 2026-02-25 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4816f65e05b6"
+down_revision: Union[str, Sequence[str], None] = "dcd034f5dfb5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns holding serial ids, id references, or IBKR conIds. Each table is
+# altered in one statement so Postgres rewrites it once.
+_BIGINT_COLUMNS = {
+    "accounts": ("id",),
+    "jobs": ("id",),
+    "orders": ("id", "account_id", "con_id"),
+    "order_events": ("id", "order_id"),
+    "worker_heartbeats": ("id",),
+    "contracts": ("id", "con_id"),
+    "positions": ("id", "account_id", "con_id"),
+    "watch_lists": ("id",),
+    "watch_list_instruments": ("id", "watch_list_id", "con_id"),
+}
+
+
+def _alter_column_types(table: str, columns: Sequence[str], type_name: str) -> None:
+    clauses = ", ".join(f"ALTER COLUMN {column} TYPE {type_name}" for column in columns)
+    op.execute(f"ALTER TABLE {table} {clauses}")
+    if "id" in columns:
+        op.execute(f"ALTER SEQUENCE {table}_id_seq AS {type_name}")
+
+
+def upgrade() -> None:
+    for table, columns in _BIGINT_COLUMNS.items():
+        _alter_column_types(table, columns, "bigint")
+
+
+def downgrade() -> None:
+    for table, columns in _BIGINT_COLUMNS.items():
+        _alter_column_types(table, columns, "integer")
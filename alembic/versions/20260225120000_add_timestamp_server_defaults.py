@@ -0,0 +1,40 @@
+"""add now() server defaults to created_at/updated_at
+
+Revision ID: 6f0c2d8a91e3
+Revises: 4816f65e05b6
+Create Date: 2026-02-25 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f0c2d8a91e3"
+down_revision: Union[str, Sequence[str], None] = "4816f65e05b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMP_COLUMNS = {
+    "orders": ("created_at", "updated_at"),
+    "order_events": ("created_at",),
+    "jobs": ("created_at", "updated_at"),
+    "contracts": ("created_at", "updated_at"),
+    "worker_heartbeats": ("updated_at",),
+}
+
+
+def upgrade() -> None:
+    # Catalog-only change; existing rows are not touched.
+    for table, columns in _TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, columns in _TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=None)
@@ -0,0 +1,49 @@
+"""add order_events.order_id foreign key
+
+Revision ID: c58a1e2f7b94
+Revises: 6f0c2d8a91e3
+Create Date: 2026-02-25 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "c58a1e2f7b94"
+down_revision: Union[str, Sequence[str], None] = "6f0c2d8a91e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_ORPHAN_ORDER_IDS_SQL = sa.text(
+    "SELECT DISTINCT e.order_id FROM order_events e WHERE NOT EXISTS (SELECT 1 FROM orders o WHERE o.id = e.order_id) ORDER BY e.order_id"
+)
+
+
+def upgrade() -> None:
+    # Events whose order is gone would fail validation. They are audit
+    # history, so stop and report them rather than deleting them.
+    if not context.is_offline_mode():
+        orphan_order_ids = op.get_bind().execute(_ORPHAN_ORDER_IDS_SQL).scalars().all()
+        if orphan_order_ids:
+            raise RuntimeError(
+                f"order_events references {len(orphan_order_ids)} missing order id(s): "
+                f"{orphan_order_ids[:20]}. Restore or archive these events before upgrading."
+            )
+
+    # Add NOT VALID first so only a brief lock is taken. Validation runs in
+    # its own transaction, which holds a SHARE UPDATE EXCLUSIVE lock that does
+    # not block writes during the scan.
+    op.execute(
+        "ALTER TABLE order_events ADD CONSTRAINT fk_order_events_order_id_orders FOREIGN KEY (order_id) REFERENCES orders (id) ON DELETE CASCADE NOT VALID"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE order_events VALIDATE CONSTRAINT fk_order_events_order_id_orders")
+
+
+def downgrade() -> None:
+    op.drop_constraint("fk_order_events_order_id_orders", "order_events", type_="foreignkey")
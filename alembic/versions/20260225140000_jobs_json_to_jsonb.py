@@ -0,0 +1,26 @@
+"""convert jobs payload/result to jsonb
+
+Revision ID: 9d41b6e07a2c
+Revises: c58a1e2f7b94
+Create Date: 2026-02-25 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d41b6e07a2c"
+down_revision: Union[str, Sequence[str], None] = "c58a1e2f7b94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Both columns in one statement so the table is rewritten once.
+    op.execute("ALTER TABLE jobs ALTER COLUMN payload TYPE jsonb USING payload::jsonb, ALTER COLUMN result TYPE jsonb USING result::jsonb")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE jobs ALTER COLUMN payload TYPE json USING payload::json, ALTER COLUMN result TYPE json USING result::json")
@@ -0,0 +1,36 @@
+"""add (created_at, id) indexes for keyset-paginated job and order lists
+
+Revision ID: 0ec843ef2d3b
+Revises: 9d41b6e07a2c
+Create Date: 2026-02-25 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0ec843ef2d3b"
+down_revision: Union[str, Sequence[str], None] = "9d41b6e07a2c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The list endpoints page newest-first on (created_at, id); a backward scan of
+# these serves each page without sorting the table.
+_KEYSET_INDEXES = {
+    "ix_jobs_created_at_id": "jobs",
+    "ix_orders_created_at_id": "orders",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table in _KEYSET_INDEXES.items():
+            op.create_index(index_name, table, ["created_at", "id"], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table in _KEYSET_INDEXES.items():
+            op.drop_index(index_name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""add partial (created_at, id) index for unarchived jobs
+
+Revision ID: 5b8e2f7c1a94
+Revises: 0ec843ef2d3b
+Create Date: 2026-02-25 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e2f7c1a94"
+down_revision: Union[str, Sequence[str], None] = "0ec843ef2d3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_jobs hides archived rows by default; this index keeps those pages
+    # from walking past archived history. ix_jobs_created_at_id still serves
+    # include_archived=true.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_active_created_at_id",
+            "jobs",
+            ["created_at", "id"],
+            postgresql_where=sa.text("archived_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_jobs_active_created_at_id",
+            table_name="jobs",
+            postgresql_concurrently=True,
+        )
@@ -6,20 +6,11 @@ Usage:
 """
 
 import argparse
-import os
-
-from dotenv import load_dotenv
 
 from src.db import get_engine
 from src.services.position_sync import check_positions_tables_ready, sync_positions_once
-from src.utils.env_vars import get_int_env
-
-
-def load_env(env_name: str) -> None:
-    env_file = f".env.{env_name}"
-    if not os.path.exists(env_file):
-        raise FileNotFoundError(f"{env_file} not found")
-    load_dotenv(env_file)
+from src.settings import get_settings
+from src.utils.env_loader import load_env
 
 
 def main():
@@ -33,7 +24,7 @@ def main():
     check_positions_tables_ready(engine)
 
     host = "127.0.0.1"
-    port = get_int_env("BROKER_TWS_PORT", 7497)
+    port = get_settings().broker_tws_port or 7497
     client_id = 2
 
     print(f"Connecting to TWS at {host}:{port} ...")
@@ -8,13 +8,12 @@ from __future__ import annotations
 
 import argparse
 import logging
-import os
 
-from dotenv import load_dotenv
 from ib_async import IB
 
 from src.services.ibkr_select_contracts import select_contract_for_watchlist
-from src.utils.env_vars import get_int_env
+from src.settings import get_settings
+from src.utils.env_loader import load_env
 
 logger = logging.getLogger("scripts:fetch-cl-contracts")
 
@@ -24,20 +23,20 @@ def main() -> int:
     parser.add_argument("--env", choices=["dev", "prod"], default="dev")
     args = parser.parse_args()
 
-    env_file = f".env.{args.env}"
-    if not os.path.exists(env_file):
-        raise FileNotFoundError(f"{env_file} not found")
-    load_dotenv(env_file)
+    load_env(args.env)
 
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s %(name)s %(levelname)s %(message)s",
     )
+    # ib_async logs every handshake/qualification step at INFO.
+    logging.getLogger("ib_async").setLevel(logging.WARNING)
 
     host = "127.0.0.1"
     # Use environment variables if set; fall back to standard local TWS defaults.
-    port = get_int_env("BROKER_TWS_PORT", 7496)
-    client_id = get_int_env("BROKER_TWS_CLIENT_ID", 50)
+    settings = get_settings()
+    port = settings.broker_tws_port or 7496
+    client_id = settings.broker_tws_client_id or 50
 
     ib = IB()
     try:
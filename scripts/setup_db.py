@@ -8,18 +8,13 @@ Usage:
 
 import argparse
 import os
-import subprocess  # noqa: S404  # nosec B404
-import sys
 
-from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 
-
-def load_env(env_name: str) -> None:
-    env_file = f".env.{env_name}"
-    if not os.path.exists(env_file):
-        raise FileNotFoundError(f"{env_file} not found")
-    load_dotenv(env_file)
+from alembic import command
+from alembic import config as alembic_config
+from src.db import get_engine
+from src.utils.env_loader import load_env
 
 
 def main():
@@ -52,22 +47,19 @@ def main():
 
     engine.dispose()
 
-    # Run alembic migrations
+    # Run alembic migrations in-process; env.py picks up this connection.
     print("Running migrations ...")
-    result = subprocess.run(  # noqa: S603  # nosec B603
-        [sys.executable, "-m", "alembic", "upgrade", "head"],
-        env={
-            **os.environ,
-            "DB_HOST": host,
-            "DB_PORT": port,
-            "DB_NAME": db_name,
-            "DB_USER": user,
-            "DB_PASSWORD": password,
-        },
-    )
-    if result.returncode != 0:
-        print("Migration failed!")
-        raise SystemExit(1)
+    alembic_cfg = alembic_config.Config("alembic.ini")
+    migrate_engine = get_engine(db_name)
+    try:
+        with migrate_engine.connect() as connection:
+            alembic_cfg.attributes["connection"] = connection
+            command.upgrade(alembic_cfg, "head")
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise SystemExit(1) from e
+    finally:
+        migrate_engine.dispose()
 
     print("Done. Database is ready.")
 
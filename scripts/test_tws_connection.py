@@ -10,19 +10,11 @@ Usage:
 """
 
 import argparse
-import os
 
-from dotenv import load_dotenv
 from ib_async import IB
 
-from src.utils.env_vars import get_int_env
-
-
-def load_env(env_name: str) -> None:
-    env_file = f".env.{env_name}"
-    if not os.path.exists(env_file):
-        raise FileNotFoundError(f"{env_file} not found")
-    load_dotenv(env_file)
+from src.settings import get_settings
+from src.utils.env_loader import load_env
 
 
 def main():
@@ -33,7 +25,7 @@ def main():
     load_env(args.env)
 
     host = "127.0.0.1"
-    port = get_int_env("BROKER_TWS_PORT", 7497)
+    port = get_settings().broker_tws_port or 7497
 
     print(f"Connecting to TWS at {host}:{port} ...")
 
@@ -44,14 +36,12 @@ def main():
         print()
         print(f"  Server version: {ib.client.serverVersion()}")
 
-        accounts = ib.managedAccounts()
-        for acct in accounts:
+        # One summary fetch for all accounts, indexed by account for lookup.
+        net_liquidation = {item.account: item.value for item in ib.accountSummary() if item.tag == "NetLiquidation"}
+        for acct in ib.managedAccounts():
             print(f"  Account: {acct[:3]}{'*' * (len(acct) - 3)}")
-            summary = ib.accountSummary(acct)
-            for item in summary:
-                if item.tag == "NetLiquidation":
-                    print(f"  Net Liquidation: ${float(item.value):,.2f}")
-                    break
+            if acct in net_liquidation:
+                print(f"  Net Liquidation: ${float(net_liquidation[acct]):,.2f}")
     except Exception as e:
         print(f"Connection failed: {e}")
         raise SystemExit(1) from e
@@ -13,173 +13,264 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+import select
 import time
 from collections.abc import Callable
-
-from dotenv import load_dotenv
-from sqlalchemy import inspect
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import Future as PoolFuture
+from dataclasses import dataclass
+from typing import Any
+
+import psycopg2
+from ib_async import IB, Contract, Future
+from psycopg2.extensions import connection as PgConnection
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
-from src.db import get_engine
-from src.models import Job
+from src.db import find_missing_tables, get_database_url, get_engine
+from src.services.contract_sync import sync_contracts
 from src.services.jobs import (
+    JOB_STATUS_FAILED,
     JOB_TYPE_CONTRACTS_SYNC,
     JOB_TYPE_POSITIONS_SYNC,
     JOB_TYPE_WATCHLIST_ADD_INSTRUMENT,
     JOB_TYPE_WATCHLIST_QUOTES_REFRESH,
-    claim_next_job,
+    JOBS_NOTIFY_CHANNEL,
+    ClaimedJob,
+    claim_next_jobs,
     complete_job,
     fail_or_retry_job,
 )
-from src.services.position_sync import check_positions_tables_ready, sync_positions_once
+from src.services.position_sync import POSITIONS_REQUIRED_TABLES, sync_positions_once
+from src.services.watchlist_instrument_sync import fetch_and_add_instrument
+from src.services.watchlist_quotes import refresh_watch_list_quotes
 from src.services.worker_heartbeat import WORKER_TYPE_JOBS, upsert_worker_heartbeat
-from src.utils.env_vars import get_int_env
+from src.settings import get_settings
+from src.utils.env_loader import load_env
 
 logger = logging.getLogger("worker:jobs")
 
+# Well inside the API's 12s green window.
+HEARTBEAT_INTERVAL_SECONDS = 5.0
+# Idle waits back off from --poll-seconds up to this cap; NOTIFY still wakes the
+# worker immediately. Kept under the green window so idle heartbeats stay fresh.
+IDLE_WAIT_MAX_SECONDS = 10.0
+
 
-def load_env(env_name: str) -> None:
-    env_file = f".env.{env_name}"
-    if not os.path.exists(env_file):
-        raise FileNotFoundError(f"{env_file} not found")
-    load_dotenv(env_file)
+def positive_int(raw: str) -> int:
+    value = int(raw)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return value
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Process queued jobs.")
     parser.add_argument("--env", choices=["dev", "prod"], default="dev")
-    parser.add_argument("--poll-seconds", type=float, default=2.0)
+    parser.add_argument("--poll-seconds", type=float, default=2.0, help="Initial idle wait between queue passes when no NOTIFY arrives.")
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=None,
+        help="Max jobs claimed per queue round-trip (default: --concurrency). Claimed jobs show as running until they finish.",
+    )
+    parser.add_argument("--concurrency", type=positive_int, default=1, help="Job types run in parallel (jobs of one type stay serial).")
     parser.add_argument("--once", action="store_true", help="Process one queue pass and exit.")
     return parser.parse_args()
 
 
 def check_db_ready() -> None:
-    engine = get_engine()
-    check_positions_tables_ready(engine)
-    tables = inspect(engine).get_table_names()
-    for required in ("jobs", "worker_heartbeats"):
-        if required not in tables:
+    # One catalog round-trip covers the worker's tables and the positions handler's.
+    required_tables = (*POSITIONS_REQUIRED_TABLES, "jobs", "worker_heartbeats")
+    missing = find_missing_tables(get_engine(), required_tables)
+    for required in required_tables:
+        if required in missing:
             raise SystemExit(f"Missing '{required}' table. Run: task migrate")
 
 
-def handle_positions_sync(job: Job, engine: Engine) -> dict:
-    payload = job.payload or {}
-    host = str(payload.get("host") or "127.0.0.1")
-    port_raw = payload.get("port")
-    client_id_raw = payload.get("client_id")
-    connect_timeout_raw = payload.get("connect_timeout_seconds")
+def open_jobs_listener() -> PgConnection:
+    # Dedicated autocommit connection so NOTIFYs arrive while the worker is idle.
+    conn = psycopg2.connect(get_database_url())
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(f"LISTEN {JOBS_NOTIFY_CHANNEL}")
+    return conn
 
-    if isinstance(port_raw, int):
-        port = port_raw
-    else:
-        port = get_int_env("BROKER_TWS_PORT")
+
+def wait_for_jobs(listener: PgConnection, timeout_seconds: float, wake_fd: int | None = None) -> None:
+    # Wake on the first NOTIFY, or on `wake_fd` when a pooled job group frees
+    # a slot; the timeout still picks up retries whose available_at has passed.
+    watched: list[Any] = [listener] if wake_fd is None else [listener, wake_fd]
+    readable, _, _ = select.select(watched, [], [], timeout_seconds)
+    if listener in readable:
+        listener.poll()
+        listener.notifies.clear()
+    if wake_fd is not None and wake_fd in readable:
+        os.read(wake_fd, 4096)
+
+
+# Shared stand-in for jobs enqueued without a payload; handlers only read it.
+_EMPTY_PAYLOAD: dict[str, object] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class IbConnectArgs:
+    host: str
+    port: int
+    client_id: int
+
+
+def _parse_ib_connect_args(payload: dict, default_client_id: int) -> IbConnectArgs:
+    port = payload.get("port")
+    if not isinstance(port, int):
+        port = get_settings().broker_tws_port
     if port is None:
         raise RuntimeError("BROKER_TWS_PORT is not set and no port was provided in job payload.")
 
-    if isinstance(client_id_raw, int):
-        client_id = client_id_raw
-    else:
-        client_id = 31
+    client_id = payload.get("client_id")
+    if not isinstance(client_id, int):
+        client_id = default_client_id
+
+    return IbConnectArgs(host=str(payload.get("host") or "127.0.0.1"), port=port, client_id=client_id)
+
+
+class IbConnectionPool:
+    """Connected IB handles reused across jobs, keyed by (host, port, client_id).
+
+    An IB handle is bound to the event loop of the thread that connected it, and
+    TWS rejects a second connection with the same client_id, so the pool is only
+    enabled when jobs run serially on the main thread.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._handles: dict[tuple[str, int, int], IB] = {}
+
+    def get(self, conn: IbConnectArgs) -> IB | None:
+        # Services connect the handle on first use (or after TWS dropped it)
+        # and leave it open because they don't own it.
+        if not self.enabled:
+            return None
+        key = (conn.host, conn.port, conn.client_id)
+        ib = self._handles.get(key)
+        if ib is None:
+            ib = self._handles[key] = IB()
+        return ib
+
+    def close(self) -> None:
+        for ib in self._handles.values():
+            if ib.isConnected():
+                ib.disconnect()
+        self._handles.clear()
+
+
+_IB_POOL = IbConnectionPool()
+
 
+@dataclass(frozen=True, slots=True)
+class PositionsSyncArgs:
+    conn: IbConnectArgs
+    connect_timeout_seconds: float
+
+
+def validate_positions_sync(payload: dict) -> PositionsSyncArgs:
+    connect_timeout_raw = payload.get("connect_timeout_seconds")
     if isinstance(connect_timeout_raw, (int, float)):
         connect_timeout_seconds = float(connect_timeout_raw)
     else:
         connect_timeout_seconds = 20.0
 
+    return PositionsSyncArgs(
+        conn=_parse_ib_connect_args(payload, default_client_id=31),
+        connect_timeout_seconds=connect_timeout_seconds,
+    )
+
+
+def execute_positions_sync(args: PositionsSyncArgs, engine: Engine) -> dict:
+    conn = args.conn
     fetched_positions_count = sync_positions_once(
         engine=engine,
-        host=host,
-        port=port,
-        client_id=client_id,
-        connect_timeout_seconds=connect_timeout_seconds,
+        host=conn.host,
+        port=conn.port,
+        client_id=conn.client_id,
+        connect_timeout_seconds=args.connect_timeout_seconds,
+        ib=_IB_POOL.get(conn),
     )
     return {
         "fetched_positions_count": fetched_positions_count,
-        "host": host,
-        "port": port,
-        "client_id": client_id,
-        "connect_timeout_seconds": connect_timeout_seconds,
+        "host": conn.host,
+        "port": conn.port,
+        "client_id": conn.client_id,
+        "connect_timeout_seconds": args.connect_timeout_seconds,
     }
 
 
-def handle_contracts_sync(job: Job, engine: Engine) -> dict:
-    from ib_async import Contract, Future
+# Default to CL futures when the payload carries no usable specs. Shared across
+# jobs; sync_contracts only reads them.
+_DEFAULT_SPECS: tuple[Contract, ...] = (Future("CL", exchange="NYMEX", currency="USD"),)
 
-    from src.services.contract_sync import sync_contracts
 
-    payload = job.payload or {}
-    host = str(payload.get("host") or "127.0.0.1")
-    port_raw = payload.get("port")
-    client_id_raw = payload.get("client_id")
+def _parse_spec(raw: object) -> Contract | None:
+    if not isinstance(raw, dict):
+        return None
+    sec_type = raw.get("sec_type", "FUT").upper()
+    symbol = raw.get("symbol", "CL")
+    exchange = raw.get("exchange", "")
+    currency = raw.get("currency", "USD")
 
-    if isinstance(port_raw, int):
-        port = port_raw
-    else:
-        port = get_int_env("BROKER_TWS_PORT")
-    if port is None:
-        raise RuntimeError("BROKER_TWS_PORT is not set and no port was provided in job payload.")
+    if not exchange:
+        raise RuntimeError(f"No exchange specified for {symbol} {sec_type}. " "The job payload must include an exchange.")
 
-    if isinstance(client_id_raw, int):
-        client_id = client_id_raw
-    else:
-        client_id = 32
+    if sec_type == "FUT":
+        return Future(symbol=symbol, exchange=exchange, currency=currency)
+    if sec_type in ("STK", "OPT"):
+        exchange = "SMART"
+    return Contract(symbol=symbol, secType=sec_type, exchange=exchange, currency=currency)
 
-    # Build contract specs from payload, default to CL futures
+
+@dataclass(frozen=True, slots=True)
+class ContractsSyncArgs:
+    conn: IbConnectArgs
+    specs: tuple[Contract, ...]
+
+
+def validate_contracts_sync(payload: dict) -> ContractsSyncArgs:
     raw_specs = payload.get("specs")
-    specs: list[Contract]
-    if isinstance(raw_specs, list) and raw_specs:
-        specs = []
-        for raw in raw_specs:
-            if not isinstance(raw, dict):
-                continue
-            sec_type = raw.get("sec_type", "FUT").upper()
-            symbol = raw.get("symbol", "CL")
-            exchange = raw.get("exchange", "")
-            currency = raw.get("currency", "USD")
-
-            if not exchange:
-                raise RuntimeError(f"No exchange specified for {symbol} {sec_type}. " "The job payload must include an exchange.")
-
-            if sec_type == "FUT":
-                specs.append(Future(symbol=symbol, exchange=exchange, currency=currency))
-            elif sec_type in ("STK", "OPT"):
-                specs.append(
-                    Contract(
-                        symbol=symbol,
-                        secType=sec_type,
-                        exchange="SMART",
-                        currency=currency,
-                    )
-                )
-            else:
-                specs.append(
-                    Contract(
-                        symbol=symbol,
-                        secType=sec_type,
-                        exchange=exchange,
-                        currency=currency,
-                    )
-                )
-        if not specs:
-            specs = [Future("CL", exchange="NYMEX", currency="USD")]
-    else:
-        specs = [Future("CL", exchange="NYMEX", currency="USD")]
+    specs: tuple[Contract, ...] = ()
+    if isinstance(raw_specs, list):
+        specs = tuple(spec for raw in raw_specs if (spec := _parse_spec(raw)) is not None)
+
+    return ContractsSyncArgs(
+        conn=_parse_ib_connect_args(payload, default_client_id=32),
+        specs=specs or _DEFAULT_SPECS,
+    )
 
+
+def execute_contracts_sync(args: ContractsSyncArgs, engine: Engine) -> dict:
+    conn = args.conn
     return sync_contracts(
         engine=engine,
-        host=host,
-        port=port,
-        client_id=client_id,
-        specs=specs,
+        host=conn.host,
+        port=conn.port,
+        client_id=conn.client_id,
+        specs=list(args.specs),
+        ib=_IB_POOL.get(conn),
     )
 
 
-def handle_watchlist_add_instrument(job: Job, engine: Engine) -> dict:
-    from src.services.watchlist_instrument_sync import fetch_and_add_instrument
+@dataclass(frozen=True, slots=True)
+class WatchlistAddInstrumentArgs:
+    conn: IbConnectArgs
+    watch_list_id: int
+    symbol: str
+    sec_type: str
+    exchange: str
+    contract_month: str | None
+    strike: float | None
+    right: str | None
 
-    payload = job.payload or {}
 
+def validate_watchlist_add_instrument(payload: dict) -> WatchlistAddInstrumentArgs:
     watch_list_id = payload.get("watch_list_id")
     if not isinstance(watch_list_id, int):
         raise ValueError("watchlist.add_instrument job requires integer 'watch_list_id' in payload.")
@@ -207,27 +298,8 @@ def handle_watchlist_add_instrument(job: Job, engine: Engine) -> dict:
     if right is not None and not isinstance(right, str):
         raise ValueError("'right' must be a string if provided.")
 
-    host = str(payload.get("host") or "127.0.0.1")
-    port_raw = payload.get("port")
-    client_id_raw = payload.get("client_id")
-
-    if isinstance(port_raw, int):
-        port = port_raw
-    else:
-        port = get_int_env("BROKER_TWS_PORT")
-    if port is None:
-        raise RuntimeError("BROKER_TWS_PORT is not set and no port was provided in job payload.")
-
-    if isinstance(client_id_raw, int):
-        client_id = client_id_raw
-    else:
-        client_id = 34
-
-    return fetch_and_add_instrument(
-        engine=engine,
-        host=host,
-        port=port,
-        client_id=client_id,
+    return WatchlistAddInstrumentArgs(
+        conn=_parse_ib_connect_args(payload, default_client_id=34),
         watch_list_id=watch_list_id,
         symbol=symbol.strip().upper(),
         sec_type=sec_type.strip().upper(),
@@ -238,49 +310,169 @@ def handle_watchlist_add_instrument(job: Job, engine: Engine) -> dict:
     )
 
 
-def handle_watchlist_quotes_refresh(job: Job, engine: Engine) -> dict:
-    from src.services.watchlist_quotes import refresh_watch_list_quotes
+def execute_watchlist_add_instrument(args: WatchlistAddInstrumentArgs, engine: Engine) -> dict:
+    conn = args.conn
+    return fetch_and_add_instrument(
+        engine=engine,
+        host=conn.host,
+        port=conn.port,
+        client_id=conn.client_id,
+        watch_list_id=args.watch_list_id,
+        symbol=args.symbol,
+        sec_type=args.sec_type,
+        exchange=args.exchange,
+        contract_month=args.contract_month,
+        strike=args.strike,
+        right=args.right,
+        ib=_IB_POOL.get(conn),
+    )
+
 
-    payload = job.payload or {}
+@dataclass(frozen=True, slots=True)
+class WatchlistQuotesRefreshArgs:
+    conn: IbConnectArgs
+    watch_list_id: int
+
+
+def validate_watchlist_quotes_refresh(payload: dict) -> WatchlistQuotesRefreshArgs:
     watch_list_id = payload.get("watch_list_id")
     if not isinstance(watch_list_id, int):
         raise ValueError("watchlist.quotes_refresh job requires integer 'watch_list_id' in payload.")
 
-    host = str(payload.get("host") or "127.0.0.1")
-    port_raw = payload.get("port")
-    client_id_raw = payload.get("client_id")
-
-    if isinstance(port_raw, int):
-        port = port_raw
-    else:
-        port = get_int_env("BROKER_TWS_PORT")
-    if port is None:
-        raise RuntimeError("BROKER_TWS_PORT is not set and no port was provided in job payload.")
+    return WatchlistQuotesRefreshArgs(
+        conn=_parse_ib_connect_args(payload, default_client_id=get_settings().broker_tws_quotes_client_id),
+        watch_list_id=watch_list_id,
+    )
 
-    if isinstance(client_id_raw, int):
-        client_id = client_id_raw
-    else:
-        client_id = get_int_env("BROKER_TWS_QUOTES_CLIENT_ID", 141)
-    if client_id is None:
-        raise RuntimeError("BROKER_TWS_QUOTES_CLIENT_ID is not set and no client_id was provided in job payload.")
 
+def execute_watchlist_quotes_refresh(args: WatchlistQuotesRefreshArgs, engine: Engine) -> dict:
+    conn = args.conn
     return refresh_watch_list_quotes(
         engine=engine,
-        watch_list_id=watch_list_id,
-        host=host,
-        port=port,
-        client_id=client_id,
+        watch_list_id=args.watch_list_id,
+        host=conn.host,
+        port=conn.port,
+        client_id=conn.client_id,
+        ib=_IB_POOL.get(conn),
     )
 
 
-def get_handler(job_type: str) -> Callable[[Job, Engine], dict] | None:
-    handlers: dict[str, Callable[[Job, Engine], dict]] = {
-        JOB_TYPE_POSITIONS_SYNC: handle_positions_sync,
-        JOB_TYPE_CONTRACTS_SYNC: handle_contracts_sync,
-        JOB_TYPE_WATCHLIST_ADD_INSTRUMENT: handle_watchlist_add_instrument,
-        JOB_TYPE_WATCHLIST_QUOTES_REFRESH: handle_watchlist_quotes_refresh,
-    }
-    return handlers.get(job_type)
+# job_type -> (validator, executor). Validators are pure payload parsing; a
+# payload they reject fails the same way on every attempt.
+JobDispatch = tuple[Callable[[dict], Any], Callable[[Any, Engine], dict]]
+
+_DISPATCH: dict[str, JobDispatch] = {
+    JOB_TYPE_POSITIONS_SYNC: (validate_positions_sync, execute_positions_sync),
+    JOB_TYPE_CONTRACTS_SYNC: (validate_contracts_sync, execute_contracts_sync),
+    JOB_TYPE_WATCHLIST_ADD_INSTRUMENT: (validate_watchlist_add_instrument, execute_watchlist_add_instrument),
+    JOB_TYPE_WATCHLIST_QUOTES_REFRESH: (validate_watchlist_quotes_refresh, execute_watchlist_quotes_refresh),
+}
+
+
+def get_dispatch(job_type: str) -> JobDispatch | None:
+    return _DISPATCH.get(job_type)
+
+
+def run_job(session: Session, engine: Engine, job: ClaimedJob) -> None:
+    dispatch = get_dispatch(job.job_type)
+    if dispatch is None:
+        logger.warning("job #%d: unsupported job_type '%s'", job.id, job.job_type)
+        fail_or_retry_job(
+            session,
+            job.id,
+            f"Unsupported job_type '{job.job_type}'",
+            retry_delay_seconds=0,
+        )
+        session.commit()
+        return
+
+    validate, execute = dispatch
+    try:
+        args = validate(job.payload or _EMPTY_PAYLOAD)
+    except Exception as exc:
+        fail_or_retry_job(session, job.id, str(exc), retryable=False)
+        logger.error("job #%d: invalid payload for %s — %s", job.id, job.job_type, exc)
+        session.commit()
+        return
+
+    logger.info("job #%d: starting %s", job.id, job.job_type)
+    try:
+        result = execute(args, engine)
+        complete_job(session, job.id, result)
+        logger.info("job #%d: completed %s", job.id, job.job_type)
+    except Exception as exc:
+        # A failed handler may have left a pooled connection mid-request; start fresh.
+        _IB_POOL.close()
+        status = fail_or_retry_job(session, job.id, str(exc))
+        outcome = "failed" if status == JOB_STATUS_FAILED else "will retry"
+        logger.error("job #%d: %s %s — %s", job.id, outcome, job.job_type, exc)
+    # Commit per job so status is visible and survives a crash mid-batch.
+    session.commit()
+
+
+def run_job_group(engine: Engine, jobs: list[ClaimedJob]) -> None:
+    with Session(engine) as session:
+        for job in jobs:
+            run_job(session, engine, job)
+
+
+def group_jobs_by_type(jobs: list[ClaimedJob]) -> list[list[ClaimedJob]]:
+    # Handlers default to one TWS client_id per job type, so jobs of the same
+    # type must not run at the same time.
+    groups: dict[str, list[ClaimedJob]] = {}
+    for job in jobs:
+        groups.setdefault(job.job_type, []).append(job)
+    return list(groups.values())
+
+
+class JobGroupPool:
+    """Runs claimed jobs on worker threads, at most one group per job type.
+
+    Each finished group writes to a wake pipe, so the claim loop refills a free
+    slot as soon as it opens instead of waiting for the slowest group.
+    """
+
+    def __init__(self, engine: Engine, slots: int) -> None:
+        self._engine = engine
+        self._slots = slots
+        self._executor = ThreadPoolExecutor(max_workers=slots)
+        self._inflight: dict[PoolFuture[None], str] = {}
+        self.wake_fd, self._wake_write_fd = os.pipe()
+
+    def free_slots(self) -> int:
+        self._reap()
+        return self._slots - len(self._inflight)
+
+    def busy_job_types(self) -> set[str]:
+        return set(self._inflight.values())
+
+    def submit(self, jobs: list[ClaimedJob]) -> None:
+        for group in group_jobs_by_type(jobs):
+            future = self._executor.submit(run_job_group, self._engine, group)
+            self._inflight[future] = group[0].job_type
+            future.add_done_callback(self._wake)
+
+    def wait_for_slot(self) -> None:
+        wait(self._inflight, return_when=FIRST_COMPLETED)
+
+    def wait_all(self) -> None:
+        wait(self._inflight)
+        self._reap()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        os.close(self.wake_fd)
+        os.close(self._wake_write_fd)
+
+    def _wake(self, _future: PoolFuture[None]) -> None:
+        os.write(self._wake_write_fd, b"\0")
+
+    def _reap(self) -> None:
+        for future in [future for future in self._inflight if future.done()]:
+            del self._inflight[future]
+            # run_job records handler errors itself; anything raised here is a
+            # worker fault (e.g. lost DB) and should stop the loop as before.
+            future.result()
 
 
 def main() -> int:
@@ -300,60 +492,76 @@ def main() -> int:
         details="worker boot",
     )
 
+    listener = open_jobs_listener()
+    pool = JobGroupPool(engine, args.concurrency) if args.concurrency > 1 else None
+    _IB_POOL.enabled = pool is None
+    last_heartbeat = time.monotonic()
+    processed_since_heartbeat = 0
+    idle_wait = args.poll_seconds
+    idle_wait_max = max(IDLE_WAIT_MAX_SECONDS, args.poll_seconds)
+    # Claiming marks jobs running, so by default claim no more than can start now.
+    batch_size = args.batch_size or args.concurrency
     try:
         while True:
             processed = 0
             while True:
-                with Session(engine) as session:
-                    claimed_job = claim_next_job(session)
-                    if claimed_job is None:
-                        break
-                    job_id = claimed_job.id
-                    session.commit()
-
-                processed += 1
-                with Session(engine) as session:
-                    job = session.get(Job, job_id)
-                    if job is None:
-                        session.rollback()
+                limit = batch_size
+                busy_job_types: set[str] = set()
+                if pool is not None:
+                    free_slots = pool.free_slots()
+                    if free_slots == 0:
+                        if not args.once:
+                            break
+                        pool.wait_for_slot()
                         continue
+                    limit = min(batch_size, free_slots)
+                    busy_job_types = pool.busy_job_types()
 
-                    handler = get_handler(job.job_type)
-                    if handler is None:
-                        logger.warning("job #%d: unsupported job_type '%s'", job_id, job.job_type)
-                        fail_or_retry_job(
-                            session,
-                            job,
-                            f"Unsupported job_type '{job.job_type}'",
-                            retry_delay_seconds=0,
-                        )
-                        session.commit()
-                        continue
-
-                    logger.info("job #%d: starting %s", job_id, job.job_type)
-                    try:
-                        result = handler(job, engine)
-                        complete_job(session, job, result)
-                        logger.info("job #%d: completed %s", job_id, job.job_type)
-                    except Exception as exc:
-                        fail_or_retry_job(session, job, str(exc))
-                        logger.error("job #%d: failed %s — %s", job_id, job.job_type, exc)
+                with Session(engine) as session:
+                    claimed_jobs = claim_next_jobs(session, limit=limit, exclude_job_types=busy_job_types)
                     session.commit()
-
-            upsert_worker_heartbeat(
-                engine,
-                WORKER_TYPE_JOBS,
-                status="running",
-                details=f"processed={processed}",
-            )
+                if not claimed_jobs:
+                    if args.once and pool is not None and pool.busy_job_types():
+                        # Queued jobs of a busy type were skipped; finish this pass.
+                        pool.wait_for_slot()
+                        continue
+                    break
+
+                processed += len(claimed_jobs)
+                if pool is None:
+                    run_job_group(engine, claimed_jobs)
+                else:
+                    pool.submit(claimed_jobs)
+
+            if args.once and pool is not None:
+                pool.wait_all()
+
+            processed_since_heartbeat += processed
+            now = time.monotonic()
+            if args.once or now - last_heartbeat >= HEARTBEAT_INTERVAL_SECONDS:
+                upsert_worker_heartbeat(
+                    engine,
+                    WORKER_TYPE_JOBS,
+                    status="running",
+                    details=f"processed={processed_since_heartbeat}",
+                )
+                last_heartbeat = now
+                processed_since_heartbeat = 0
 
             if args.once:
                 print(f"Processed {processed} job(s).")
                 return 0
 
-            if processed == 0:
-                time.sleep(args.poll_seconds)
+            if processed:
+                idle_wait = args.poll_seconds
+            else:
+                wait_for_jobs(listener, idle_wait, None if pool is None else pool.wake_fd)
+                idle_wait = min(idle_wait_max, idle_wait * 1.5)
     finally:
+        if pool is not None:
+            pool.shutdown()
+        _IB_POOL.close()
+        listener.close()
         try:
             upsert_worker_heartbeat(
                 engine,
@@ -1,13 +1,21 @@
 """FastAPI dependencies for database access."""
 
 from collections.abc import Generator
+from functools import lru_cache
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.db import get_engine
 
 
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker[Session]:
+    # Built on first request rather than at import: main.py calls load_dotenv()
+    # after the routers (and this module) are imported. One engine means one
+    # connection pool shared by every request.
+    return sessionmaker(bind=get_engine(), expire_on_commit=False)
+
+
 def get_db() -> Generator[Session, None, None]:
-    engine = get_engine()
-    with Session(engine) as session:
+    with get_session_factory()() as session:
         yield session
@@ -0,0 +1,43 @@
+"""Keyset pagination helpers for newest-first list endpoints."""
+
+import base64
+import binascii
+from datetime import datetime
+
+from fastapi import HTTPException, Query
+
+DEFAULT_PAGE_LIMIT = 200
+MAX_PAGE_LIMIT = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Module-level so routers share one Query definition (B008).
+LIMIT_QUERY = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT)
+# For endpoints whose existing clients expect the full list when unpaged.
+OPTIONAL_LIMIT_QUERY = Query(default=None, ge=1, le=MAX_PAGE_LIMIT)
+CURSOR_QUERY = Query(default=None, description=f"Opaque cursor from a previous response's {NEXT_CURSOR_HEADER} header.")
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at_raw, row_id_raw = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at_raw), int(row_id_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def paginate(rows: list, limit: int) -> tuple[list, dict[str, str]]:
+    """Trim a `limit + 1` fetch to `limit` rows and build next-page headers.
+
+    Rows need `created_at` and `id`. Pages stay plain lists so existing
+    clients keep working; the next-page cursor travels in a response header.
+    """
+    if len(rows) <= limit:
+        return rows, {}
+    page = rows[:limit]
+    last = page[-1]
+    return page, {NEXT_CURSOR_HEADER: encode_cursor(last.created_at, last.id)}
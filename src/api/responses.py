@@ -0,0 +1,13 @@
+"""Response helpers for read-only list endpoints."""
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_list_response(adapter: TypeAdapter, items: list, headers: dict[str, str] | None = None) -> Response:
+    """Serialize already-validated items to JSON bytes in pydantic-core.
+
+    FastAPI returns a Response as-is, so the route's response_model still
+    documents the schema but is not re-validated or re-encoded with json.dumps.
+    """
+    return Response(content=adapter.dump_json(items), media_type="application/json", headers=headers)
@@ -32,8 +32,9 @@ class AccountUpdate(BaseModel):
 
 @router.get("/accounts", response_model=list[AccountResponse])
 def list_accounts(db: Session = DB_SESSION_DEPENDENCY):
-    result = db.execute(select(Account))
-    return result.scalars().all()
+    # Plain rows of just the response columns; no ORM objects to hydrate.
+    result = db.execute(select(Account.id, Account.account, Account.alias))
+    return result.all()
 
 
 @router.get("/accounts/{account_id}", response_model=AccountResponse)
@@ -2,12 +2,14 @@
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_db
+from src.api.pagination import CURSOR_QUERY, LIMIT_QUERY, decode_cursor, paginate
+from src.api.responses import json_list_response
 from src.models import Job
 from src.services.jobs import now_utc
 
@@ -36,37 +38,25 @@ class JobResponse(BaseModel):
     updated_at: datetime
 
 
-def to_job_response(job: Job) -> JobResponse:
-    return JobResponse(
-        id=job.id,
-        job_type=job.job_type,
-        status=job.status,
-        payload=job.payload,
-        result=job.result,
-        source=job.source,
-        request_text=job.request_text,
-        attempts=job.attempts,
-        max_attempts=job.max_attempts,
-        available_at=job.available_at,
-        started_at=job.started_at,
-        completed_at=job.completed_at,
-        archived_at=job.archived_at,
-        last_error=job.last_error,
-        created_at=job.created_at,
-        updated_at=job.updated_at,
-    )
+# One pydantic-core call validates a whole page straight from ORM attributes.
+_JOB_LIST_ADAPTER = TypeAdapter(list[JobResponse])
 
 
 @router.get("/jobs", response_model=list[JobResponse])
 def list_jobs(
     include_archived: bool = Query(default=False),
+    limit: int = LIMIT_QUERY,
+    cursor: str | None = CURSOR_QUERY,
     db: Session = DB_SESSION_DEPENDENCY,
-) -> list[JobResponse]:
+) -> Response:
     stmt = select(Job)
     if not include_archived:
         stmt = stmt.where(Job.archived_at.is_(None))
-    rows = db.execute(stmt.order_by(Job.created_at.desc())).scalars().all()
-    return [to_job_response(job) for job in rows]
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Job.created_at, Job.id) < tuple_(*decode_cursor(cursor)))
+    rows = db.execute(stmt.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit + 1)).scalars().all()
+    page, headers = paginate(rows, limit)
+    return json_list_response(_JOB_LIST_ADAPTER, _JOB_LIST_ADAPTER.validate_python(page, from_attributes=True), headers)
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
@@ -74,7 +64,7 @@ def get_job(job_id: int, db: Session = DB_SESSION_DEPENDENCY) -> JobResponse:
     job = db.get(Job, job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    return to_job_response(job)
+    return JobResponse.model_validate(job)
 
 
 @router.post("/jobs/{job_id}/archive", response_model=JobResponse)
@@ -88,4 +78,4 @@ def archive_job(job_id: int, db: Session = DB_SESSION_DEPENDENCY) -> JobResponse
         job.updated_at = now
         db.commit()
         db.refresh(job)
-    return to_job_response(job)
+    return JobResponse.model_validate(job)
@@ -2,12 +2,20 @@
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_db
+from src.api.pagination import (
+    CURSOR_QUERY,
+    DEFAULT_PAGE_LIMIT,
+    OPTIONAL_LIMIT_QUERY,
+    decode_cursor,
+    paginate,
+)
+from src.api.responses import json_list_response
 from src.models import Account, Order, OrderEvent
 
 router = APIRouter()
@@ -61,77 +69,49 @@ class OrderEventResponse(BaseModel):
     created_at: datetime
 
 
-def to_order_response(order: Order, account: Account | None) -> OrderResponse:
-    alias = account.alias if account and account.alias else None
-    return OrderResponse(
-        id=order.id,
-        account_id=order.account_id,
-        account_alias=alias,
-        symbol=order.symbol,
-        sec_type=order.sec_type,
-        exchange=order.exchange,
-        currency=order.currency,
-        side=order.side,
-        quantity=order.quantity,
-        order_type=order.order_type,
-        tif=order.tif,
-        status=order.status,
-        source=order.source,
-        con_id=order.con_id,
-        local_symbol=order.local_symbol,
-        trading_class=order.trading_class,
-        contract_month=order.contract_month,
-        contract_expiry=order.contract_expiry,
-        ib_order_id=order.ib_order_id,
-        ib_perm_id=order.ib_perm_id,
-        filled_quantity=order.filled_quantity,
-        avg_fill_price=order.avg_fill_price,
-        last_error=order.last_error,
-        request_text=order.request_text,
-        submitted_at=order.submitted_at,
-        completed_at=order.completed_at,
-        created_at=order.created_at,
-        updated_at=order.updated_at,
-    )
-
-
-def to_order_event_response(event: OrderEvent) -> OrderEventResponse:
-    return OrderEventResponse(
-        id=event.id,
-        order_id=event.order_id,
-        event_type=event.event_type,
-        message=event.message,
-        status=event.status,
-        filled_quantity=event.filled_quantity,
-        avg_fill_price=event.avg_fill_price,
-        ib_order_id=event.ib_order_id,
-        created_at=event.created_at,
-    )
+# Orders come back as flat rows (order columns + account_alias) that pydantic
+# validates directly; blank aliases read as missing, as before.
+_ORDER_COLUMNS = (*Order.__table__.columns, func.nullif(Account.alias, "").label("account_alias"))
+# Base statement built once; per-request .where()/.order_by() derive from it.
+_ORDERS_WITH_ALIAS = select(*_ORDER_COLUMNS).outerjoin(Account, Order.account_id == Account.id)
+_ORDER_LIST_ADAPTER = TypeAdapter(list[OrderResponse])
+_ORDER_EVENT_LIST_ADAPTER = TypeAdapter(list[OrderEventResponse])
 
 
 @router.get("/orders", response_model=list[OrderResponse])
-def list_orders(db: Session = DB_SESSION_DEPENDENCY) -> list[OrderResponse]:
-    stmt = select(Order, Account).outerjoin(Account, Order.account_id == Account.id).order_by(Order.created_at.desc())
-    rows = db.execute(stmt).all()
-    return [to_order_response(order, account) for order, account in rows]
+def list_orders(
+    limit: int | None = OPTIONAL_LIMIT_QUERY,
+    cursor: str | None = CURSOR_QUERY,
+    db: Session = DB_SESSION_DEPENDENCY,
+) -> Response:
+    stmt = _ORDERS_WITH_ALIAS.order_by(Order.created_at.desc(), Order.id.desc())
+    if limit is None and cursor is None:
+        # OrdersTable renders the whole history from one unpaged fetch.
+        rows = db.execute(stmt).all()
+        return json_list_response(_ORDER_LIST_ADAPTER, _ORDER_LIST_ADAPTER.validate_python(rows, from_attributes=True))
+    if limit is None:
+        limit = DEFAULT_PAGE_LIMIT
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Order.created_at, Order.id) < tuple_(*decode_cursor(cursor)))
+    rows = db.execute(stmt.limit(limit + 1)).all()
+    page, headers = paginate(rows, limit)
+    return json_list_response(_ORDER_LIST_ADAPTER, _ORDER_LIST_ADAPTER.validate_python(page, from_attributes=True), headers)
 
 
 @router.get("/orders/{order_id}", response_model=OrderResponse)
 def get_order(order_id: int, db: Session = DB_SESSION_DEPENDENCY) -> OrderResponse:
-    stmt = select(Order, Account).outerjoin(Account, Order.account_id == Account.id).where(Order.id == order_id)
+    stmt = _ORDERS_WITH_ALIAS.where(Order.id == order_id)
     row = db.execute(stmt).one_or_none()
     if row is None:
         raise HTTPException(status_code=404, detail="Order not found")
-    order, account = row
-    return to_order_response(order, account)
+    return OrderResponse.model_validate(row)
 
 
 @router.get("/orders/{order_id}/events", response_model=list[OrderEventResponse])
-def list_order_events(order_id: int, db: Session = DB_SESSION_DEPENDENCY) -> list[OrderEventResponse]:
-    order = db.get(Order, order_id)
-    if order is None:
-        raise HTTPException(status_code=404, detail="Order not found")
-
+def list_order_events(order_id: int, db: Session = DB_SESSION_DEPENDENCY) -> Response:
     stmt = select(OrderEvent).where(OrderEvent.order_id == order_id).order_by(OrderEvent.created_at)
     events = list(db.execute(stmt).scalars().all())
-    return [to_order_event_response(event) for event in events]
+    # Events imply the order exists (FK); only an empty result needs the 404 check.
+    if not events and db.execute(select(Order.id).where(Order.id == order_id)).first() is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return json_list_response(_ORDER_EVENT_LIST_ADAPTER, _ORDER_EVENT_LIST_ADAPTER.validate_python(events, from_attributes=True))
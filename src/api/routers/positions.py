@@ -2,12 +2,13 @@
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_db
+from src.api.responses import json_list_response
 from src.models import Account, Position
 
 router = APIRouter()
@@ -36,35 +37,16 @@ class PositionResponse(BaseModel):
     fetched_at: datetime
 
 
+# Alias fallbacks are computed in SQL so rows validate straight into the response.
+_POSITION_ACCOUNT_ALIAS = case(
+    (Account.id.is_(None), func.concat("Unknown Account ", Position.account_id)),
+    else_=func.coalesce(func.nullif(Account.alias, ""), func.concat("Account Alias ", Account.id)),
+).label("account_alias")
+_POSITIONS_WITH_ALIAS = select(*Position.__table__.columns, _POSITION_ACCOUNT_ALIAS).outerjoin(Account, Position.account_id == Account.id)
+_POSITION_LIST_ADAPTER = TypeAdapter(list[PositionResponse])
+
+
 @router.get("/positions", response_model=list[PositionResponse])
-def list_positions(db: Session = DB_SESSION_DEPENDENCY):
-    stmt = select(Position, Account).outerjoin(Account, Position.account_id == Account.id)
-    rows = db.execute(stmt).all()
-    results = []
-    for pos, acct in rows:
-        if acct:
-            alias = acct.alias if acct.alias else f"Account Alias {acct.id}"
-        else:
-            alias = f"Unknown Account {pos.account_id}"
-        results.append(
-            PositionResponse(
-                id=pos.id,
-                account_alias=alias,
-                con_id=pos.con_id,
-                symbol=pos.symbol,
-                sec_type=pos.sec_type,
-                exchange=pos.exchange,
-                primary_exchange=pos.primary_exchange,
-                currency=pos.currency,
-                local_symbol=pos.local_symbol,
-                trading_class=pos.trading_class,
-                last_trade_date=pos.last_trade_date,
-                strike=pos.strike,
-                right=pos.right,
-                multiplier=pos.multiplier,
-                position=pos.position,
-                avg_cost=pos.avg_cost,
-                fetched_at=pos.fetched_at,
-            )
-        )
-    return results
+def list_positions(db: Session = DB_SESSION_DEPENDENCY) -> Response:
+    rows = db.execute(_POSITIONS_WITH_ALIAS).all()
+    return json_list_response(_POSITION_LIST_ADAPTER, _POSITION_LIST_ADAPTER.validate_python(rows, from_attributes=True))
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Annotated
+
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import PlainTextResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, StringConstraints
 from sqlalchemy.orm import Session
 
 from src.api.deps import get_db
@@ -16,7 +18,8 @@ DB_SESSION_DEPENDENCY = Depends(get_db)
 
 class ChatPart(BaseModel):
     type: str
-    text: str | None = None
+    # Stripped once at parse time so the handler never re-strips.
+    text: Annotated[str, StringConstraints(strip_whitespace=True)] | None = None
 
 
 class ChatMessage(BaseModel):
@@ -29,8 +32,7 @@ class TradebotChatRequest(BaseModel):
 
 
 def _extract_message_text(message: ChatMessage) -> str:
-    parts = [part.text.strip() for part in message.parts if part.type == "text" and part.text and part.text.strip()]
-    return "\n".join(parts)
+    return "\n".join(part.text for part in message.parts if part.type == "text" and part.text)
 
 
 def _to_agent_messages(messages: list[ChatMessage]) -> list[ChatInputMessage]:
@@ -3,16 +3,19 @@
 from datetime import datetime, timezone
 
 from sqlalchemy import (
-    JSON,
+    BigInteger,
     Boolean,
     DateTime,
     Float,
+    ForeignKey,
     Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -41,8 +44,8 @@ class ContractRef(Base):
         ),
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    con_id: Mapped[int] = mapped_column(Integer, unique=True, nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    con_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
     symbol: Mapped[str] = mapped_column(String, nullable=False)
     sec_type: Mapped[str] = mapped_column(String, nullable=False)
     exchange: Mapped[str] = mapped_column(String, nullable=False)
@@ -64,19 +67,19 @@ class ContractRef(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
 
 class Account(Base):
     __tablename__ = "accounts"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     account: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     alias: Mapped[str | None] = mapped_column(String, nullable=True)
 
@@ -85,9 +88,9 @@ class Position(Base):
     __tablename__ = "positions"
     __table_args__ = (UniqueConstraint("account_id", "con_id", name="uq_account_id_con_id"),)
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    account_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    con_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    account_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    con_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     symbol: Mapped[str | None] = mapped_column(String)
     sec_type: Mapped[str | None] = mapped_column(String)
     exchange: Mapped[str | None] = mapped_column(String)
@@ -111,8 +114,8 @@ class Position(Base):
 class Order(Base):
     __tablename__ = "orders"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    account_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    account_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     symbol: Mapped[str] = mapped_column(String, nullable=False)
     sec_type: Mapped[str] = mapped_column(String, nullable=False, default="FUT")
     exchange: Mapped[str] = mapped_column(String, nullable=False, default="NYMEX")
@@ -123,7 +126,7 @@ class Order(Base):
     tif: Mapped[str] = mapped_column(String, nullable=False, default="DAY")
     status: Mapped[str] = mapped_column(String, nullable=False, default="queued")
     source: Mapped[str] = mapped_column(String, nullable=False, default="tradebot")
-    con_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    con_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     local_symbol: Mapped[str | None] = mapped_column(String, nullable=True)
     trading_class: Mapped[str | None] = mapped_column(String, nullable=True)
     contract_month: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -139,20 +142,24 @@ class Order(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
 
 class OrderEvent(Base):
     __tablename__ = "order_events"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    order_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    order_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("orders.id", name="fk_order_events_order_id_orders", ondelete="CASCADE"),
+        nullable=False,
+    )
     event_type: Mapped[str] = mapped_column(String, nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
     status: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -162,18 +169,18 @@ class OrderEvent(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
 
 class Job(Base):
     __tablename__ = "jobs"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     job_type: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False, default="queued")
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     source: Mapped[str] = mapped_column(String, nullable=False, default="tradebot")
     request_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -190,19 +197,19 @@ class Job(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
 
 class WatchList(Base):
     __tablename__ = "watch_lists"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -230,9 +237,9 @@ class WatchListInstrument(Base):
         ),
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    watch_list_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    con_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    watch_list_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    con_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     symbol: Mapped[str] = mapped_column(String, nullable=False)
     sec_type: Mapped[str] = mapped_column(String, nullable=False)
     exchange: Mapped[str] = mapped_column(String, nullable=False)
@@ -260,7 +267,7 @@ class WorkerHeartbeat(Base):
     __tablename__ = "worker_heartbeats"
     __table_args__ = (UniqueConstraint("worker_type", name="uq_worker_heartbeats_worker_type"),)
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     worker_type: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False, default="running")
     details: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -272,5 +279,5 @@ class WorkerHeartbeat(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from ib_async import IB, Contract
-from sqlalchemy import Engine
+from sqlalchemy import Engine, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
@@ -15,6 +15,24 @@ from src.services.cl_contracts import (
     infer_contract_month_from_local_symbol,
 )
 
+CONTRACT_UPSERT_COLUMNS = (
+    "symbol",
+    "sec_type",
+    "exchange",
+    "currency",
+    "local_symbol",
+    "trading_class",
+    "contract_month",
+    "contract_expiry",
+    "multiplier",
+    "strike",
+    "right",
+    "primary_exchange",
+    "is_active",
+    "fetched_at",
+    "updated_at",
+)
+
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
@@ -27,28 +45,41 @@ def sync_contracts(
     client_id: int,
     specs: list[Contract],
     connect_timeout_seconds: float = 20.0,
+    ib: IB | None = None,
 ) -> dict:
     """Fetch contract details from IB for each spec and upsert into the contracts table.
 
-    Returns a summary dict with counts.
+    Pass ``ib`` to reuse a caller-owned handle; it is connected if needed and
+    left open. Returns a summary dict with counts.
     """
-    ib = IB()
+    owns_ib = ib is None
+    if ib is None:
+        ib = IB()
     try:
-        try:
-            ib.connect(host, port, clientId=client_id, timeout=connect_timeout_seconds)
-        except TimeoutError as exc:
-            raise RuntimeError(f"Timed out connecting to TWS/Gateway for contract sync " f"(host={host}, port={port}, client_id={client_id}).") from exc
+        if not ib.isConnected():
+            try:
+                ib.connect(host, port, clientId=client_id, timeout=connect_timeout_seconds)
+            except TimeoutError as exc:
+                raise RuntimeError(f"Timed out connecting to TWS/Gateway for contract sync " f"(host={host}, port={port}, client_id={client_id}).") from exc
 
         all_con_ids: set[int] = set()
         synced_count = 0
         now = _now_utc()
 
+        # Built once; rows are bound per execute so the SQL compiles once.
+        upsert_stmt = insert(ContractRef)
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=["con_id"],
+            set_={column: upsert_stmt.excluded[column] for column in CONTRACT_UPSERT_COLUMNS},
+        )
+
         for spec in specs:
             contract_details = ib.reqContractDetails(spec)
             if not contract_details:
                 continue
 
-            spec_con_ids: set[int] = set()
+            # Keyed by con_id: a multi-row upsert cannot touch the same row twice.
+            rows_by_con_id: dict[int, dict] = {}
 
             with Session(engine) as session:
                 for detail in contract_details:
@@ -63,7 +94,7 @@ def sync_contracts(
                         sec_type=contract.secType or spec.secType or "FUT",
                     ) or format_contract_month_from_expiry(raw_expiry)
 
-                    values = {
+                    rows_by_con_id[contract.conId] = {
                         "con_id": contract.conId,
                         "symbol": contract.symbol or spec.symbol or "UNKNOWN",
                         "sec_type": contract.secType or spec.secType or "FUT",
@@ -81,23 +112,14 @@ def sync_contracts(
                         "fetched_at": now,
                         "updated_at": now,
                     }
-
-                    stmt = (
-                        insert(ContractRef)
-                        .values(**values, created_at=now)
-                        .on_conflict_do_update(
-                            index_elements=["con_id"],
-                            set_={k: v for k, v in values.items() if k != "con_id"},
-                        )
-                    )
-                    session.execute(stmt)
-                    spec_con_ids.add(contract.conId)
                     synced_count += 1
 
+                spec_con_ids = set(rows_by_con_id)
+                if rows_by_con_id:
+                    session.execute(upsert_stmt, list(rows_by_con_id.values()))
+
                 # Mark contracts for this spec that were NOT returned as inactive
                 if spec_con_ids:
-                    from sqlalchemy import update
-
                     session.execute(
                         update(ContractRef)
                         .where(
@@ -119,5 +141,5 @@ def sync_contracts(
             "specs_count": len(specs),
         }
     finally:
-        if ib.isConnected():
+        if owns_ib and ib.isConnected():
             ib.disconnect()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select, true, update
 from sqlalchemy.orm import Session
 
 from src.models import Job
@@ -19,6 +21,19 @@ JOB_TYPE_CONTRACTS_SYNC = "contracts.sync"
 JOB_TYPE_WATCHLIST_ADD_INSTRUMENT = "watchlist.add_instrument"
 JOB_TYPE_WATCHLIST_QUOTES_REFRESH = "watchlist.quotes_refresh"
 
+# Workers LISTEN on this channel; notifications are delivered on commit.
+JOBS_NOTIFY_CHANNEL = "jobs_new"
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimedJob:
+    """The columns a worker needs from a claimed job row."""
+
+    id: int
+    job_type: str
+    payload: dict | None
+    created_at: datetime
+
 
 def now_utc() -> datetime:
     return datetime.now(timezone.utc)
@@ -43,12 +58,11 @@ def enqueue_job(
         attempts=0,
         max_attempts=max_attempts,
         available_at=now,
-        created_at=now,
-        updated_at=now,
         archived_at=None,
     )
     session.add(job)
     session.flush()
+    session.execute(select(func.pg_notify(JOBS_NOTIFY_CHANNEL, job_type)))
     return job
 
 
@@ -78,47 +92,73 @@ def enqueue_job_if_idle(
     )
 
 
-def claim_next_job(session: Session) -> Job | None:
+def claim_next_jobs(session: Session, limit: int, exclude_job_types: Collection[str] = ()) -> list[ClaimedJob]:
+    """Claim up to `limit` runnable jobs in one statement, oldest first.
+
+    SKIP LOCKED lets concurrent workers claim disjoint batches without waiting.
+    Rows come back as plain ClaimedJob values rather than ORM objects, so the
+    claim/complete/fail path carries no identity-map or change-tracking cost.
+    Jobs whose type is in `exclude_job_types` are left queued.
+    """
     now = now_utc()
+    runnable_ids = select(Job.id).where(
+        Job.status == JOB_STATUS_QUEUED,
+        Job.available_at <= now,
+        Job.archived_at.is_(None),
+    )
+    if exclude_job_types:
+        runnable_ids = runnable_ids.where(Job.job_type.not_in(exclude_job_types))
+    runnable_ids = runnable_ids.order_by(Job.created_at.asc()).limit(limit).with_for_update(skip_locked=True)
     stmt = (
-        select(Job)
-        .where(
-            Job.status == JOB_STATUS_QUEUED,
-            Job.available_at <= now,
-            Job.archived_at.is_(None),
-        )
-        .order_by(Job.created_at.asc())
-        .limit(1)
+        update(Job)
+        .where(Job.id.in_(runnable_ids.scalar_subquery()))
+        .values(status=JOB_STATUS_RUNNING, started_at=now, updated_at=now)
+        .returning(Job.id, Job.job_type, Job.payload, Job.created_at)
     )
-    job = session.execute(stmt).scalars().first()
-    if job is None:
-        return None
-    job.status = JOB_STATUS_RUNNING
-    job.started_at = now
-    job.updated_at = now
-    session.flush()
-    return job
+    jobs = [ClaimedJob(*row) for row in session.execute(stmt)]
+    jobs.sort(key=lambda job: job.created_at)
+    return jobs
 
 
-def complete_job(session: Session, job: Job, result: dict) -> None:
+def complete_job(session: Session, job_id: int, result: dict) -> None:
     now = now_utc()
-    job.status = JOB_STATUS_COMPLETED
-    job.result = result
-    job.completed_at = now
-    job.updated_at = now
-    session.flush()
+    session.execute(
+        update(Job)
+        .where(Job.id == job_id)
+        .values(
+            status=JOB_STATUS_COMPLETED,
+            result=result,
+            completed_at=now,
+            updated_at=now,
+        )
+    )
 
 
-def fail_or_retry_job(session: Session, job: Job, error_text: str, retry_delay_seconds: int = 5) -> None:
+def fail_or_retry_job(
+    session: Session,
+    job_id: int,
+    error_text: str,
+    retry_delay_seconds: int = 5,
+    retryable: bool = True,
+) -> str:
+    """Record a failed attempt; requeue it unless attempts are exhausted.
+
+    Decided in SQL against the row's current attempts, so no read is needed.
+    Returns the job's new status.
+    """
     now = now_utc()
-    job.attempts += 1
-    job.last_error = error_text
-    job.updated_at = now
-
-    if job.attempts >= job.max_attempts:
-        job.status = JOB_STATUS_FAILED
-        job.completed_at = now
-    else:
-        job.status = JOB_STATUS_QUEUED
-        job.available_at = now + timedelta(seconds=retry_delay_seconds)
-    session.flush()
+    exhausted = true() if not retryable else Job.attempts + 1 >= Job.max_attempts
+    stmt = (
+        update(Job)
+        .where(Job.id == job_id)
+        .values(
+            attempts=Job.attempts + 1,
+            last_error=error_text,
+            updated_at=now,
+            status=case((exhausted, JOB_STATUS_FAILED), else_=JOB_STATUS_QUEUED),
+            completed_at=case((exhausted, now), else_=Job.completed_at),
+            available_at=case((exhausted, Job.available_at), else_=now + timedelta(seconds=retry_delay_seconds)),
+        )
+        .returning(Job.status)
+    )
+    return session.execute(stmt).scalar_one()
@@ -2,53 +2,200 @@
 
 from __future__ import annotations
 
+import asyncio
+import csv
+import io
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime, timezone
+from typing import Any
 
 from ib_async import IB
-from sqlalchemy import Engine, delete, inspect, select
+from ib_async import Position as IBPosition
+from ib_async import util
+from sqlalchemy import Engine, select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
+from src.db import find_missing_tables
 from src.models import Account, Position
 
+POSITIONS_REQUIRED_TABLES = ("positions", "accounts")
+
+POSITION_UPSERT_COLUMNS = (
+    "symbol",
+    "sec_type",
+    "exchange",
+    "primary_exchange",
+    "currency",
+    "local_symbol",
+    "trading_class",
+    "last_trade_date",
+    "strike",
+    "right",
+    "multiplier",
+    "position",
+    "avg_cost",
+    "fetched_at",
+)
+POSITION_COPY_COLUMNS = ("account_id", "con_id", *POSITION_UPSERT_COLUMNS)
+_POSITION_COLUMN_LIST = ", ".join(f'"{column}"' for column in POSITION_COPY_COLUMNS)
+
 
 def check_positions_tables_ready(engine: Engine) -> None:
-    inspector = inspect(engine)
-    tables = inspector.get_table_names()
-    for required in ("positions", "accounts"):
-        if required not in tables:
+    missing = find_missing_tables(engine, POSITIONS_REQUIRED_TABLES)
+    for required in POSITIONS_REQUIRED_TABLES:
+        if required in missing:
             raise RuntimeError(f"'{required}' table does not exist. Run: task migrate")
 
 
-def get_or_create_accounts(session: Session, account_strings: set[str]) -> dict[str, int]:
-    lookup: dict[str, int] = {}
-    for account_string in account_strings:
-        row = session.execute(select(Account).where(Account.account == account_string)).scalar_one_or_none()
-        if row is None:
-            row = Account(account=account_string)
-            session.add(row)
-            session.flush()
-        lookup[account_string] = row.id
+def load_account_lookup(engine: Engine) -> dict[str, int]:
+    with Session(engine) as session:
+        return {account: account_id for account_id, account in session.execute(select(Account.id, Account.account))}
+
+
+def get_or_create_accounts(
+    session: Session,
+    account_strings: set[str],
+    known_accounts: Mapping[str, int] | None = None,
+) -> dict[str, int]:
+    if not account_strings:
+        return {}
+
+    if known_accounts is None:
+        lookup: dict[str, int] = {
+            account: account_id for account_id, account in session.execute(select(Account.id, Account.account).where(Account.account.in_(account_strings)))
+        }
+    else:
+        lookup = {account: known_accounts[account] for account in account_strings if account in known_accounts}
+    missing = account_strings - lookup.keys()
+    if missing:
+        inserted = session.execute(
+            insert(Account)
+            .values([{"account": account} for account in missing])
+            .on_conflict_do_nothing(index_elements=["account"])
+            .returning(Account.id, Account.account)
+        )
+        lookup.update({account: account_id for account_id, account in inserted})
+
+        # Rows inserted concurrently by another session are skipped by DO NOTHING.
+        still_missing = account_strings - lookup.keys()
+        if still_missing:
+            lookup.update(
+                {account: account_id for account_id, account in session.execute(select(Account.id, Account.account).where(Account.account.in_(still_missing)))}
+            )
     return lookup
 
 
+def _iter_position_rows(
+    positions: Iterable[IBPosition],
+    account_lookup: dict[str, int],
+    fetched_at: datetime,
+) -> Iterator[dict[str, Any]]:
+    # IB can report the same (account, conId) twice in one snapshot. Keep the
+    # last row per key: COPY would hit uq_account_id_con_id, and ON CONFLICT
+    # cannot update one row twice in a statement.
+    rows: dict[tuple[int, int], dict[str, Any]] = {}
+    for position in positions:
+        contract = position.contract
+        account_id = account_lookup[position.account]
+        rows[(account_id, contract.conId)] = {
+            "account_id": account_id,
+            "con_id": contract.conId,
+            "symbol": contract.symbol,
+            "sec_type": contract.secType,
+            "exchange": contract.exchange,
+            "primary_exchange": contract.primaryExchange,
+            "currency": contract.currency,
+            "local_symbol": contract.localSymbol,
+            "trading_class": contract.tradingClass,
+            "last_trade_date": contract.lastTradeDateOrContractMonth,
+            "strike": contract.strike,
+            "right": contract.right,
+            "multiplier": contract.multiplier,
+            "position": position.position,
+            "avg_cost": position.avgCost,
+            "fetched_at": fetched_at,
+        }
+    yield from rows.values()
+
+
+def _copy_position_rows(session: Session, table: str, rows: Iterable[dict[str, Any]]) -> None:
+    buffer = io.StringIO()
+    # QUOTE_NOTNULL leaves None unquoted (NULL to COPY) while '' stays ''.
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL, lineterminator="\n")
+    for row in rows:
+        writer.writerow([row[column] for column in POSITION_COPY_COLUMNS])
+    buffer.seek(0)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table} ({_POSITION_COLUMN_LIST}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+
+def _merge_position_rows(session: Session, rows: Iterable[dict[str, Any]], scope_account_ids: set[int]) -> None:
+    # COPY the snapshot into a transaction-scoped staging table, then reconcile
+    # positions with two set-based statements instead of row-wise writes.
+    session.execute(text(f"CREATE TEMP TABLE positions_stg ON COMMIT DROP AS SELECT {_POSITION_COLUMN_LIST} FROM positions WITH NO DATA"))
+    _copy_position_rows(session, "positions_stg", rows)
+
+    set_clause = ", ".join(f'"{column}" = EXCLUDED."{column}"' for column in POSITION_UPSERT_COLUMNS)
+    session.execute(
+        text(
+            f"INSERT INTO positions ({_POSITION_COLUMN_LIST}) SELECT {_POSITION_COLUMN_LIST} FROM positions_stg "
+            f"ON CONFLICT ON CONSTRAINT uq_account_id_con_id DO UPDATE SET {set_clause}"
+        )
+    )
+    # Positions closed since the last sync, limited to the fetched accounts.
+    session.execute(
+        text(
+            "DELETE FROM positions p WHERE p.account_id = ANY(:account_ids) "
+            "AND NOT EXISTS (SELECT 1 FROM positions_stg s WHERE s.account_id = p.account_id AND s.con_id = p.con_id)"
+        ),
+        {"account_ids": list(scope_account_ids)},
+    )
+
+
+async def _connect_and_fetch_positions(
+    ib: IB,
+    host: str,
+    port: int,
+    client_id: int,
+    connect_timeout_seconds: float,
+) -> list[IBPosition]:
+    if ib.isConnected():
+        # A reused connection's position cache may lag TWS; request a fresh set.
+        return await ib.reqPositionsAsync()
+    try:
+        await ib.connectAsync(host, port, clientId=client_id, timeout=connect_timeout_seconds)
+    except TimeoutError as exc:
+        raise RuntimeError(
+            "Timed out connecting to TWS/Gateway while fetching positions "
+            f"(host={host}, port={port}, client_id={client_id}, timeout={connect_timeout_seconds}s)."
+        ) from exc
+    return ib.positions()
+
+
 def sync_positions_once(
     engine: Engine,
     host: str,
     port: int,
     client_id: int,
     connect_timeout_seconds: float = 20.0,
+    ib: IB | None = None,
 ) -> int:
-    ib = IB()
+    # A caller-provided ib is connected if needed and left open.
+    owns_ib = ib is None
+    if ib is None:
+        ib = IB()
     try:
-        try:
-            ib.connect(host, port, clientId=client_id, timeout=connect_timeout_seconds)
-        except TimeoutError as exc:
-            raise RuntimeError(
-                "Timed out connecting to TWS/Gateway while fetching positions "
-                f"(host={host}, port={port}, client_id={client_id}, timeout={connect_timeout_seconds}s)."
-            ) from exc
-        positions = ib.positions()
+        # Load the (small) accounts table on a worker thread while the TWS
+        # handshake and position fetch are in flight.
+        positions, known_accounts = util.run(
+            _connect_and_fetch_positions(ib, host, port, client_id, connect_timeout_seconds),
+            asyncio.to_thread(load_account_lookup, engine),
+        )
         position_accounts = {position.account for position in positions if position.account}
         scope_accounts = position_accounts
 
@@ -58,61 +205,22 @@ def sync_positions_once(
                 session.commit()
                 return 0
 
-            account_lookup = get_or_create_accounts(session, scope_accounts)
+            # Positions are a cache of TWS state and can be re-fetched, so this
+            # transaction does not need to wait for its WAL flush on commit.
+            session.execute(text("SET LOCAL synchronous_commit = off"))
+
+            account_lookup = get_or_create_accounts(session, scope_accounts, known_accounts)
             scope_account_ids = {account_lookup[account] for account in scope_accounts}
 
-            # Replace semantics per fetched account scope:
-            # clear prior snapshot rows for these accounts, then insert fresh rows.
-            if scope_account_ids:
-                session.execute(delete(Position).where(Position.account_id.in_(scope_account_ids)))
-
-            for position in positions:
-                contract = position.contract
-                account_id = account_lookup[position.account]
-                stmt = (
-                    insert(Position)
-                    .values(
-                        account_id=account_id,
-                        con_id=contract.conId,
-                        symbol=contract.symbol,
-                        sec_type=contract.secType,
-                        exchange=contract.exchange,
-                        primary_exchange=contract.primaryExchange,
-                        currency=contract.currency,
-                        local_symbol=contract.localSymbol,
-                        trading_class=contract.tradingClass,
-                        last_trade_date=contract.lastTradeDateOrContractMonth,
-                        strike=contract.strike,
-                        right=contract.right,
-                        multiplier=contract.multiplier,
-                        position=position.position,
-                        avg_cost=position.avgCost,
-                        fetched_at=now,
-                    )
-                    .on_conflict_do_update(
-                        constraint="uq_account_id_con_id",
-                        set_={
-                            "symbol": contract.symbol,
-                            "sec_type": contract.secType,
-                            "exchange": contract.exchange,
-                            "primary_exchange": contract.primaryExchange,
-                            "currency": contract.currency,
-                            "local_symbol": contract.localSymbol,
-                            "trading_class": contract.tradingClass,
-                            "last_trade_date": contract.lastTradeDateOrContractMonth,
-                            "strike": contract.strike,
-                            "right": contract.right,
-                            "multiplier": contract.multiplier,
-                            "position": position.position,
-                            "avg_cost": position.avgCost,
-                            "fetched_at": now,
-                        },
-                    )
-                )
-                session.execute(stmt)
+            rows = _iter_position_rows(positions, account_lookup, now)
+            if session.execute(select(Position.id).limit(1)).first() is None:
+                # Empty table: nothing to conflict with or reconcile.
+                _copy_position_rows(session, "positions", rows)
+            else:
+                _merge_position_rows(session, rows, scope_account_ids)
 
             session.commit()
         return len(positions)
     finally:
-        if ib.isConnected():
+        if owns_ib and ib.isConnected():
             ib.disconnect()
@@ -37,17 +37,22 @@ def fetch_and_add_instrument(
     strike: float | None = None,
     right: str | None = None,
     connect_timeout_seconds: float = 20.0,
+    ib: IB | None = None,
 ) -> dict:
     """Fetch a single contract from IBKR, upsert into contract_refs, and add to watch list.
 
-    Returns a dict with instrument details.
+    Pass ``ib`` to reuse a caller-owned handle; it is connected if needed and
+    left open. Returns a dict with instrument details.
     """
-    ib = IB()
+    owns_ib = ib is None
+    if ib is None:
+        ib = IB()
     try:
-        try:
-            ib.connect(host, port, clientId=client_id, timeout=connect_timeout_seconds)
-        except TimeoutError as exc:
-            raise RuntimeError(f"Timed out connecting to TWS/Gateway " f"(host={host}, port={port}, client_id={client_id}).") from exc
+        if not ib.isConnected():
+            try:
+                ib.connect(host, port, clientId=client_id, timeout=connect_timeout_seconds)
+            except TimeoutError as exc:
+                raise RuntimeError(f"Timed out connecting to TWS/Gateway " f"(host={host}, port={port}, client_id={client_id}).") from exc
 
         contract, match_count = select_contract_for_watchlist(
             ib=ib,
@@ -167,5 +172,5 @@ def fetch_and_add_instrument(
             "already_existed": already_existed,
         }
     finally:
-        if ib.isConnected():
+        if owns_ib and ib.isConnected():
             ib.disconnect()
@@ -29,7 +29,7 @@ def _safe_price(value: object) -> float | None:
     if not isinstance(value, Real) or isinstance(value, bool):
         return None
     parsed = float(value)
-    if math.isnan(parsed) or math.isinf(parsed):
+    if not math.isfinite(parsed):
         return None
     return parsed
 
@@ -88,6 +88,7 @@ def refresh_watch_list_quotes(
     port: int,
     client_id: int,
     connect_timeout_seconds: float = 10.0,
+    ib: IB | None = None,
 ) -> dict[str, int | str]:
     with Session(engine) as session:
         instruments = list(
@@ -105,19 +106,23 @@ def refresh_watch_list_quotes(
 
         contracts = [_to_contract(inst) for inst in instruments]
 
-        ib = IB()
+        # A caller-provided ib is connected if needed and left open.
+        owns_ib = ib is None
+        if ib is None:
+            ib = IB()
         try:
-            try:
-                ib.connect(
-                    host,
-                    port,
-                    clientId=client_id,
-                    timeout=connect_timeout_seconds,
-                )
-            except Exception as exc:
-                raise RuntimeError(
-                    "Could not connect to TWS/Gateway while refreshing watch list quotes " f"(host={host}, port={port}, client_id={client_id}): {exc}"
-                ) from exc
+            if not ib.isConnected():
+                try:
+                    ib.connect(
+                        host,
+                        port,
+                        clientId=client_id,
+                        timeout=connect_timeout_seconds,
+                    )
+                except Exception as exc:
+                    raise RuntimeError(
+                        "Could not connect to TWS/Gateway while refreshing watch list quotes " f"(host={host}, port={port}, client_id={client_id}): {exc}"
+                    ) from exc
 
             ib.reqMarketDataType(3)
             try:
@@ -125,7 +130,7 @@ def refresh_watch_list_quotes(
             except Exception as exc:
                 raise RuntimeError(f"Failed to request watch list quotes from IBKR: {exc}") from exc
         finally:
-            if ib.isConnected():
+            if owns_ib and ib.isConnected():
                 ib.disconnect()
 
         by_con_id: dict[int, object] = {}
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
@@ -25,20 +25,15 @@ def upsert_worker_heartbeat(
     details: str | None = None,
 ) -> None:
     heartbeat_at = now_utc()
+    values = {
+        "status": status,
+        "details": details,
+        "heartbeat_at": heartbeat_at,
+        "updated_at": heartbeat_at,
+    }
+    # One round-trip: insert the first heartbeat, update it in place afterwards.
+    stmt = insert(WorkerHeartbeat).values(worker_type=worker_type, **values)
+    stmt = stmt.on_conflict_do_update(constraint="uq_worker_heartbeats_worker_type", set_=values)
     with Session(engine) as session:
-        row = session.execute(select(WorkerHeartbeat).where(WorkerHeartbeat.worker_type == worker_type)).scalar_one_or_none()
-        if row is None:
-            row = WorkerHeartbeat(
-                worker_type=worker_type,
-                status=status,
-                details=details,
-                heartbeat_at=heartbeat_at,
-                updated_at=heartbeat_at,
-            )
-            session.add(row)
-        else:
-            row.status = status
-            row.details = details
-            row.heartbeat_at = heartbeat_at
-            row.updated_at = heartbeat_at
+        session.execute(stmt)
         session.commit()
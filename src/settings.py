@@ -0,0 +1,32 @@
+"""Process-wide settings read once from the environment."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from src.utils.env_vars import get_int_env
+
+DEFAULT_TWS_QUOTES_CLIENT_ID = 141
+
+
+@dataclass(frozen=True)
+class Settings:
+    # Unset values stay None; each entry point keeps its own fallback.
+    broker_tws_port: int | None
+    broker_tws_client_id: int | None
+    broker_tws_quotes_client_id: int
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse settings on first use and reuse them afterwards.
+
+    Call after the env file is loaded. Cached values also avoid repeated
+    `op read` calls for 1Password references in long-running workers.
+    """
+    return Settings(
+        broker_tws_port=get_int_env("BROKER_TWS_PORT"),
+        broker_tws_client_id=get_int_env("BROKER_TWS_CLIENT_ID"),
+        broker_tws_quotes_client_id=get_int_env("BROKER_TWS_QUOTES_CLIENT_ID", DEFAULT_TWS_QUOTES_CLIENT_ID),
+    )
@@ -0,0 +1,15 @@
+"""Load `.env.<name>` files for scripts."""
+
+from __future__ import annotations
+
+from dotenv import load_dotenv
+
+
+def load_env(env_name: str) -> None:
+    env_file = f".env.{env_name}"
+    # Open directly instead of exists() + load_dotenv(path): one stat/open.
+    try:
+        with open(env_file, encoding="utf-8") as stream:
+            load_dotenv(stream=stream)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"{env_file} not found") from exc
@@ -1,6 +1,10 @@
 """Helpers for handling IBKR account identifiers safely."""
 
+from functools import lru_cache
 
+
+# Account identifiers are few and stable; every API response masks the same ones.
+@lru_cache(maxsize=256)
 def mask_ibkr_account(account: str) -> str:
     """
     Mask an account string to avoid exposing the full identifier.